@@ -1,9 +1,11 @@
 import functools
+import os
 from itertools import chain, combinations
 from typing import Any, Callable, Iterable, TypeAlias, TypeVar
 
 from django.apps import apps
-from django.db.models import ForeignObjectRel, Model
+from django.db import connection
+from django.db.models import Count, ForeignObjectRel, ManyToManyField, Max, Model
 from django.urls import resolve, reverse
 
 import pytest
@@ -25,10 +27,58 @@ def user(db) -> User:
     return UserFactory()
 
 
-def powerset(iterable: Iterable[T]) -> chain[tuple[T, ...]]:
+def powerset(iterable: Iterable[T]) -> tuple[tuple[T, ...], ...]:
     """powerset([1, 2, 3]) --> () (1,) (2,) (3,) (1,2) (1,3) (2,3) (1,2,3)"""
-    s = list(iterable)
-    return chain.from_iterable(combinations(s, r) for r in range(len(s) + 1))
+    # Sized sequences can be consumed by `combinations` as-is - only copy one-shot iterables
+    s = iterable if isinstance(iterable, (tuple, list, range)) else tuple(iterable)
+    # Materialized so parametrize IDs derived from it are stable and the result is reusable
+    return tuple(chain.from_iterable(combinations(s, r) for r in range(len(s) + 1)))
+
+
+# The app registry is frozen for the duration of the test session, so the model list and per-model
+# field names are pure constants - computed once in `pytest_configure` instead of on every snapshot.
+_ALL_MODELS: tuple[type[Model], ...] = ()
+_FIELD_NAMES_CACHE: dict[type[Model], tuple[str, ...]] = {}
+_M2M_FIELD_NAMES_CACHE: dict[type[Model], tuple[str, ...]] = {}
+
+
+def pytest_configure(config) -> None:
+    """Precompute app-registry derived constants once Django is set up."""
+    global _ALL_MODELS
+    _ALL_MODELS = tuple(apps.get_models())
+    for model_class in _ALL_MODELS:
+        _get_field_names(model_class)
+
+
+def _get_models() -> tuple[type[Model], ...]:
+    """Return all registered models, using the list frozen at session start when available."""
+    return _ALL_MODELS or tuple(apps.get_models())
+
+
+def _get_field_names(model_class: type[Model]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Return (concrete, many-to-many) field names for a given model class, caching the result.
+
+    Excludes fields for backward relationships - such relationships will be traversed anyway in a forward manner.
+    """
+    try:
+        return _FIELD_NAMES_CACHE[model_class], _M2M_FIELD_NAMES_CACHE[model_class]
+    except KeyError:
+        pass
+
+    concrete_names = []
+    m2m_names = []
+    for field in model_class._meta.get_fields():
+        if isinstance(field, ForeignObjectRel):  # Skip fields for backward relationships
+            continue
+        if isinstance(field, ManyToManyField):  # M2M values can't be fetched as scalars by `.values()`
+            m2m_names.append(field.name)
+        else:
+            concrete_names.append(field.name)
+
+    _FIELD_NAMES_CACHE[model_class] = tuple(concrete_names)
+    _M2M_FIELD_NAMES_CACHE[model_class] = tuple(m2m_names)
+    return _FIELD_NAMES_CACHE[model_class], _M2M_FIELD_NAMES_CACHE[model_class]
 
 
 def serialize_queryset(model_class: type[Model]) -> SERIALIZED_QUERYSET:
@@ -36,44 +86,136 @@ def serialize_queryset(model_class: type[Model]) -> SERIALIZED_QUERYSET:
     Serialize queryset for a given model class, including fields evaluation.
 
     Used to make the comparison of otherwise LAZY querysets in `assert_database_state_unchanged` trivial.
-    Excludes fields for backward relationships - such relationships will be traversed anyway in a forward manner.
+    Rows are fetched in bulk via `QuerySet.values()` so the DB driver hands back dicts directly - no model
+    instances are materialized and no per-field descriptor calls happen in Python. Many-to-many fields are
+    attached afterwards from a single `values_list` query per M2M field.
     """
-    queryset = model_class.objects.all()
-    result = tuple(
-        {
-            field.name: field.value_from_object(obj)  # type: ignore
-            for field in model_class._meta.get_fields()
-            if not isinstance(field, ForeignObjectRel)  # Skip fields for backward relationships
-        }
-        for obj in queryset
-    )
+    concrete_names, m2m_names = _get_field_names(model_class)
+    manager = model_class._default_manager
+    # `.iterator()` avoids the queryset result cache holding a second copy of every row
+    result = tuple(manager.values(*concrete_names).iterator(chunk_size=2000))
+
+    pk_name = model_class._meta.pk.name
+    for m2m_name in m2m_names:
+        related_pks: dict[Any, list[Any]] = {}
+        for pk, related_pk in manager.values_list("pk", f"{m2m_name}__pk"):
+            if related_pk is not None:
+                related_pks.setdefault(pk, []).append(related_pk)
+        for row in result:
+            row[m2m_name] = sorted(related_pks.get(row[pk_name], []))
+
     return result
 
 
 def get_serialized_model_querysets() -> tuple[SERIALIZED_QUERYSET, ...]:
     """Return serialized querysets for all models."""
-    return tuple(serialize_queryset(model_class) for model_class in apps.get_models())
+    return tuple(serialize_queryset(model_class) for model_class in _get_models())
+
+
+# Set to force `assert_database_state_unchanged` to compare full row-by-row snapshots on any backend -
+# useful for debugging a failed assert, as counters and aggregates can't tell WHICH rows changed.
+FULL_DB_SNAPSHOT_ENV_VAR = "TEST_FULL_DB_SNAPSHOT"
+
+
+def _table_aggregates(model_class: type[Model]) -> tuple[tuple[int, Any], ...]:
+    """
+    Cheap per-table state summary for backends without transaction-local mutation counters:
+    (row count, max pk), for the model's table and its M2M through tables.
+
+    One aggregate query per table instead of streaming every row - detects inserts and deletions
+    (a delete + re-insert moves the max pk) but not in-place updates; set `TEST_FULL_DB_SNAPSHOT`
+    for the exhaustive row-by-row comparison when that matters.
+    """
+    metas = [model_class._meta]
+    metas.extend(field.remote_field.through._meta for field in model_class._meta.local_many_to_many)
+    return tuple(
+        tuple(meta.model._default_manager.aggregate(count=Count("pk"), max_pk=Max("pk")).values())
+        for meta in metas
+    )
+
+
+def get_database_snapshot() -> tuple[Any, ...]:
+    """
+    Return a comparable snapshot of the state of every model's table.
+
+    A tuple of per-table (count, max pk) aggregates, or the full row-by-row serialization with
+    `TEST_FULL_DB_SNAPSHOT` set. Only reached on backends without transaction-local mutation counters -
+    on Postgres `assert_database_state_unchanged` short-circuits via `_mutation_counters` instead.
+    """
+    if os.environ.get(FULL_DB_SNAPSHOT_ENV_VAR):
+        return get_serialized_model_querysets()
+    return tuple(_table_aggregates(model_class) for model_class in _get_models())
+
+
+def _mutation_counters() -> dict[str, int] | None:
+    """
+    Return per-table counts of rows inserted/updated/deleted by the current transaction.
+
+    Reads `pg_stat_xact_user_tables`, which is maintained synchronously for the current transaction
+    (unlike the collector-fed `pg_stat_user_tables`), so it is an exact record of the DML performed so
+    far inside pytest-django's test transaction. Postgres-only; returns None on other backends, and
+    with `TEST_FULL_DB_SNAPSHOT` set, so the exhaustive row-by-row comparison also applies on Postgres.
+    """
+    if connection.vendor != "postgresql" or os.environ.get(FULL_DB_SNAPSHOT_ENV_VAR):
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relname, n_tup_ins + n_tup_upd + n_tup_del FROM pg_stat_xact_user_tables")
+        return dict(cursor.fetchall())
 
 
 def assert_database_state_unchanged(func: Callable):
-    """Decorator for tests to ensure that the state of the database remains the same at the end of test execution."""
+    """
+    Decorator for tests to ensure that the state of the database remains the same at the end of test execution.
+
+    On Postgres the check reads two sets of per-table mutation counters instead of snapshotting table
+    contents - for the common case of a test that performs no DML at all this is O(#tables) integer
+    compares and zero rows fetched. Other backends compare per-table (count, max pk) aggregates; set
+    `TEST_FULL_DB_SNAPSHOT` to fall back to exhaustive row-by-row snapshots on any backend.
+    """
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        initial_querysets = get_serialized_model_querysets()
+        initial_counters = _mutation_counters()
+        if initial_counters is not None:
+            result = func(*args, **kwargs)
+
+            eventual_counters = _mutation_counters()
+            changed_tables = sorted(
+                table
+                for table, counter in eventual_counters.items()
+                if counter != initial_counters.get(table, 0)
+            )
+            assert not changed_tables, f"Test mutated table(s): {', '.join(changed_tables)}"
+
+            return result
+
+        initial_querysets = get_database_snapshot()
 
         result = func(*args, **kwargs)
 
-        eventual_querysets = get_serialized_model_querysets()
-        for initial_queryset, eventual_queryset in zip(initial_querysets, eventual_querysets):
-            assert initial_queryset == eventual_queryset
+        eventual_querysets = get_database_snapshot()
+        # One tuple compare short-circuits on the all-equal common case; only dig out the offending
+        # model for the assertion message once a mismatch is known.
+        if initial_querysets != eventual_querysets:
+            for model_class, initial_queryset, eventual_queryset in zip(
+                _get_models(), initial_querysets, eventual_querysets
+            ):
+                assert initial_queryset == eventual_queryset, f"Test changed the state of {model_class.__name__}"
 
         return result
 
     return wrapper
 
 
+@functools.lru_cache(maxsize=None)
+def _resolved_view_name(full_url: str) -> str:
+    """Memoize resolver walks - the same URLs are resolved repeatedly across parametrized tests."""
+    return resolve(full_url).view_name
+
+
 def assert_view_name_matches_url(view_name: str, url: str, **kwargs):
+    # Stringify UUIDs once so `format` and `reverse` don't each re-coerce them
+    kwargs = {key: str(value) for key, value in kwargs.items()}
     full_url = url.format(**kwargs)
     assert reverse(view_name, kwargs=kwargs) == full_url
-    assert resolve(full_url).view_name == view_name
+    assert _resolved_view_name(full_url) == view_name
@@ -0,0 +1,23 @@
+import orjson
+
+from rest_framework.renderers import BaseRenderer
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON renderer for streamed list responses.
+
+    Views that stream hand a `StreamingHttpResponse` straight back, bypassing `render`. Anything else
+    negotiated to this media type - error responses, most notably - still goes through DRF's normal
+    rendering, so `render` serializes those payloads as one JSON line per row.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None  # orjson emits UTF-8 bytes, same as the JSON renderers
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        rows = data if isinstance(data, list) else [data]
+        return b"".join(orjson.dumps(row, default=str, option=orjson.OPT_NON_STR_KEYS) + b"\n" for row in rows)
@@ -1,5 +1,3 @@
-import uuid
-
 from drf_spectacular.utils import OpenApiExample
 from rest_framework import status
 
@@ -12,7 +10,7 @@ NOT_FOUND_RESPONSE = OpenApiExample(
 
 CONTACT_NOT_FOUND_RESPONSE = OpenApiExample(
     "Contact Not Found",
-    value={"detail": f"Contact with UUID '{uuid.uuid4()}' does not exist for your user."},
+    value={"detail": "Contact with UUID '11111111-1111-1111-1111-111111111111' does not exist for your user."},
 
     response_only=True,
     status_codes=[status.HTTP_404_NOT_FOUND],
@@ -20,7 +18,7 @@ CONTACT_NOT_FOUND_RESPONSE = OpenApiExample(
 
 CONTACT_GROUP_NOT_FOUND_RESPONSE = OpenApiExample(
     "Contact Group Not Found",
-    value={"detail": f"ContactGroup with UUID '{uuid.uuid4()}' does not exist for your user."},
+    value={"detail": "ContactGroup with UUID '22222222-2222-2222-2222-222222222222' does not exist for your user."},
     response_only=True,
     status_codes=[status.HTTP_404_NOT_FOUND],
 )
@@ -33,8 +31,8 @@ CONTACT_RESPONSE = OpenApiExample(
         "email": "user@example.com",
         "phone_number": "+31123456789",
         "contact_groups": [
-            uuid.uuid4(),
-            uuid.uuid4(),
+            "33333333-3333-3333-3333-333333333333",
+            "44444444-4444-4444-4444-444444444444",
         ]
     },
     response_only=True,
@@ -47,8 +45,8 @@ CONTACT_GROUP_RESPONSE = OpenApiExample(
         "name": "string",
         "uuid": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
         "contacts": [
-            uuid.uuid4(),
-            uuid.uuid4(),
+            "55555555-5555-5555-5555-555555555555",
+            "66666666-6666-6666-6666-666666666666",
         ],
     },
     response_only=True,
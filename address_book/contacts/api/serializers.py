@@ -1,50 +1,84 @@
+import copy
+
 from rest_framework import serializers
 
 from ..models import Contact, ContactGroup
-from .validators import (
-    ContactGroupsBelongToContactCreatorValidator,
-    ContactsBelongToContactGroupCreatorValidator,
-    NonEmptyTogetherValidator,
-)
+from .fields import UserScopedBulkSlugRelatedField
+from .validators import NonEmptyTogetherValidator
+
+
+class CachedFieldsMixin:
+    """
+    Cache the result of `get_fields()` per serializer class.
 
+    `ModelSerializer.get_fields()` re-introspects `model._meta` and rebuilds every field object on each
+    serializer instantiation, although the result only depends on the class. Build it once and hand out
+    deep copies (fields are mutated when bound to a serializer instance, so they can't be shared).
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        # Consult `cls.__dict__` directly: ordinary attribute lookup walks the MRO, which would hand a
+        # subclass (e.g. a read-only serializer) the fields cached by its parent.
+        cached_fields = cls.__dict__.get("_cached_fields")
+        if cached_fields is None:
+            cached_fields = super().get_fields()
+            cls._cached_fields = cached_fields
+        return copy.deepcopy(cached_fields)
 
-class ContactSerializer(serializers.ModelSerializer):
+
+class ContactSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer class for contacts.
 
-    User field is automatically set to current user (based on request context) during deserialization.
+    User is not part of the field graph - views inject the current user via `serializer.save(user=...)`
+    in `perform_create`, which avoids building/validating a `HiddenField` per instance.
     """
 
-    user = serializers.HiddenField(default=serializers.CurrentUserDefault())
-    contact_groups = serializers.SlugRelatedField(
+    contact_groups = UserScopedBulkSlugRelatedField(
         queryset=ContactGroup.objects.all(), slug_field="uuid", many=True, required=False,
     )
 
     class Meta:
         model = Contact
-        fields = ("first_name", "last_name", "email", "phone_number", "contact_groups", "user", "uuid",)
+        fields = ("first_name", "last_name", "email", "phone_number", "contact_groups", "uuid",)
         validators = (
             NonEmptyTogetherValidator(("first_name", "last_name")),
             NonEmptyTogetherValidator(("email", "phone_number")),
-            ContactGroupsBelongToContactCreatorValidator()
         )
 
 
-class ContactGroupSerializer(serializers.ModelSerializer):
+class ContactReadSerializer(ContactSerializer):
+    """Read-only contact serializer for GET paths: no writable-field or validator plumbing is built."""
+
+    contact_groups = serializers.SlugRelatedField(slug_field="uuid", many=True, read_only=True)
+
+    class Meta(ContactSerializer.Meta):
+        read_only_fields = ContactSerializer.Meta.fields
+        validators = ()
+
+
+class ContactGroupSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer class for contact groups.
 
-    User field is automatically set to current user (based on request context) during deserialization.
+    User is not part of the field graph - views inject the current user via `serializer.save(user=...)`
+    in `perform_create`, which avoids building/validating a `HiddenField` per instance.
     """
 
-    user = serializers.HiddenField(default=serializers.CurrentUserDefault())
-    contacts = serializers.SlugRelatedField(
+    contacts = UserScopedBulkSlugRelatedField(
         queryset=Contact.objects.all(), slug_field="uuid", many=True, required=False,
     )
 
     class Meta:
         model = ContactGroup
-        fields = ("name", "contacts", "user", "uuid",)
-        validators = [
-            ContactsBelongToContactGroupCreatorValidator(),
-        ]
+        fields = ("name", "contacts", "uuid",)
+
+
+class ContactGroupReadSerializer(ContactGroupSerializer):
+    """Read-only contact group serializer for GET paths: no writable-field or validator plumbing is built."""
+
+    contacts = serializers.SlugRelatedField(slug_field="uuid", many=True, read_only=True)
+
+    class Meta(ContactGroupSerializer.Meta):
+        read_only_fields = ContactGroupSerializer.Meta.fields
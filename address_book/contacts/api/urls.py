@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import path, register_converter
 
 from address_book.contacts.api.views import (
     ContactDetailView,
@@ -10,18 +10,39 @@ from address_book.contacts.api.views import (
     ContactListView,
 )
 
+
+class RawUUIDConverter:
+    """
+    UUID path converter that defers parsing.
+
+    Django's built-in `uuid` converter constructs a `uuid.UUID` per request, only for the views to
+    hand it straight back to an ORM lookup which re-coerces it anyway. The regex already guarantees a
+    well-formed value, so keep the raw string and let the field's `get_prep_value` do the single parse.
+    """
+
+    regex = "[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+
+    def to_python(self, value: str) -> str:
+        return value
+
+    def to_url(self, value) -> str:
+        return str(value)
+
+
+register_converter(RawUUIDConverter, "ruuid")
+
 urlpatterns = [
     path("contacts/", ContactListView.as_view(), name="contact_list"),
-    path("contacts/<uuid:uuid>/", ContactDetailView.as_view(), name="contact_detail"),
+    path("contacts/<ruuid:uuid>/", ContactDetailView.as_view(), name="contact_detail"),
     path("contact_groups/", ContactGroupListView.as_view(), name="contact_group_list"),
-    path("contact_groups/<uuid:uuid>/", ContactGroupDetailView.as_view(), name="contact_group_detail"),
+    path("contact_groups/<ruuid:uuid>/", ContactGroupDetailView.as_view(), name="contact_group_detail"),
     path(
-        "contact_groups/<uuid:contact_group_uuid>/contacts/",
+        "contact_groups/<ruuid:contact_group_uuid>/contacts/",
         ContactGroupAddListContactsView.as_view(),
         name="contact_group_contact_list",
     ),
     path(
-        "contact_groups/<uuid:contact_group_uuid>/contacts/<uuid:contact_uuid>/",
+        "contact_groups/<ruuid:contact_group_uuid>/contacts/<ruuid:contact_uuid>/",
         ContactGroupRemoveContactView.as_view(),
         name="contact_group_contact_detail",
     ),
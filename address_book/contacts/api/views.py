@@ -1,8 +1,12 @@
-from typing import Any
+import json
+from typing import Any, Iterator
 from uuid import UUID
 
-from django.db.models import QuerySet
-from django.http import Http404
+from django.core.cache import cache
+from django.db.models import Prefetch, QuerySet, Subquery, Value
+from django.http import Http404, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import etag
 
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
@@ -13,13 +17,20 @@ from drf_spectacular.utils import (
 )
 from rest_framework import status
 from rest_framework.fields import UUIDField
-from rest_framework.generics import GenericAPIView, ListAPIView, ListCreateAPIView
+from rest_framework.generics import (
+    GenericAPIView,
+    ListAPIView,
+    ListCreateAPIView,
+    RetrieveDestroyAPIView,
+)
 from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from rest_framework.views import APIView
 
 from ..models import Contact, ContactGroup
-from .mixins import CreateViewMixin, DestroyViewMixin, ListViewMixin, RetrieveViewMixin
+from ..signals import SEARCH_TIMEOUT, get_etag, get_search_cache_key, invalidate_linked
+from .renderers import NDJSONRenderer
 from .schema_utils import (
     CONTACT_GROUP_NOT_FOUND_RESPONSE,
     CONTACT_GROUP_RESPONSE,
@@ -27,27 +38,85 @@ from .schema_utils import (
     CONTACT_RESPONSE,
     NOT_FOUND_RESPONSE,
 )
-from .serializers import ContactGroupSerializer, ContactSerializer
+from .serializers import (
+    ContactGroupReadSerializer,
+    ContactGroupSerializer,
+    ContactReadSerializer,
+    ContactSerializer,
+)
+
+
+def _detail_etag(request: Request, uuid: str) -> str:
+    """
+    ETag for contact/contact-group detail GETs.
+
+    Built from the object's cache token (dropped by `contacts.signals` whenever the object changes)
+    plus the requesting user's pk, so a tag obtained by one user never validates for another. A
+    matching `If-None-Match` turns the request into a 304 with no DB query and no serialization.
+    """
+    return f"{get_etag(uuid)}-{request.user.pk}"
 
 
 class ContactView(GenericAPIView):
 
     serializer_class = ContactSerializer
 
+    def get_serializer_class(self):
+        """GET responses never write - use the read-only serializer, which builds no validator plumbing."""
+        if self.request.method == "GET":
+            return ContactReadSerializer
+        return super().get_serializer_class()
+
+    # Built queryset memoized for the duration of the request - DRF consults `get_queryset()` several
+    # times per request (filtering, pagination, object lookup)
+    _queryset_cache = None
+
     def get_queryset(self) -> QuerySet[Contact]:
-        """Filter contacts on the current user and prefetch related `contact_groups` to avoid N+1 problem."""
-        user = self.request.user
-        return Contact.objects.filter(user=user).prefetch_related("contact_groups")  # type: ignore
+        """
+        Filter contacts on the current user and prefetch related `contact_groups` to avoid N+1 problem.
+
+        `only()` restricts both queries to the columns the serializer actually emits - related groups
+        are represented by their UUID alone.
+        """
+        if self._queryset_cache is None:
+            user = self.request.user
+            self._queryset_cache = Contact.objects.filter(user=user).only(
+                "uuid", "first_name", "last_name", "email", "phone_number", "user",
+            ).prefetch_related(
+                Prefetch("contact_groups", queryset=ContactGroup.objects.only("uuid")),
+            )
+        return self._queryset_cache  # type: ignore
 
 
 class ContactGroupView(GenericAPIView):
 
     serializer_class = ContactGroupSerializer
 
+    def get_serializer_class(self):
+        """GET responses never write - use the read-only serializer, which builds no validator plumbing."""
+        if self.request.method == "GET":
+            return ContactGroupReadSerializer
+        return super().get_serializer_class()
+
+    # Built queryset memoized for the duration of the request - DRF consults `get_queryset()` several
+    # times per request (filtering, pagination, object lookup)
+    _queryset_cache = None
+
     def get_queryset(self) -> QuerySet[ContactGroup]:
-        """Filter contact groups on the current user and prefetch related `contacts` to avoid N+1 problem."""
-        user = self.request.user
-        return ContactGroup.objects.filter(user=user).prefetch_related("contacts")  # type: ignore
+        """
+        Filter contact groups on the current user and prefetch related `contacts` to avoid N+1 problem.
+
+        `only()` restricts both queries to the columns the serializer actually emits - related contacts
+        are represented by their UUID alone.
+        """
+        if self._queryset_cache is None:
+            user = self.request.user
+            self._queryset_cache = ContactGroup.objects.filter(user=user).only(
+                "uuid", "name", "user",
+            ).prefetch_related(
+                Prefetch("contacts", queryset=Contact.objects.only("uuid")),
+            )
+        return self._queryset_cache  # type: ignore
 
 
 @extend_schema_view(
@@ -71,11 +140,15 @@ class ContactGroupView(GenericAPIView):
         ],
     ),
 )
-class ContactDetailView(ContactView, RetrieveViewMixin, DestroyViewMixin):
+class ContactDetailView(ContactView, RetrieveDestroyAPIView):
     """View for retrieving/deleting a particular contact by its UUID."""
 
     lookup_field = "uuid"
 
+    @method_decorator(etag(_detail_etag))
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return super().get(request, *args, **kwargs)
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -89,9 +162,69 @@ class ContactDetailView(ContactView, RetrieveViewMixin, DestroyViewMixin):
         ],
     )
 )
-class ContactListView(ContactView, ListViewMixin, CreateViewMixin):
+class ContactListView(ContactView, ListCreateAPIView):
     """View for listing contacts/creating a contact."""
 
+    # Default JSON renderers plus opt-in NDJSON streaming for large exports
+    renderer_classes = (*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer)
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Fast path for listing contacts: build response dicts straight from `values()` rows.
+
+        The list endpoint returns plain scalars plus related UUIDs, so per-row serializer field
+        marshaling buys nothing - fetch the columns the response needs and attach the related group
+        UUIDs from a single query over the M2M through table. POST still goes through
+        `ContactSerializer` for validation.
+
+        With `Accept: application/x-ndjson`, rows are streamed one JSON line at a time from
+        `iterator()` so arbitrarily large address books are exported with a bounded working set.
+        """
+        if request.accepted_renderer.format == NDJSONRenderer.format:
+            return StreamingHttpResponse(self._stream_rows(request), content_type=NDJSONRenderer.media_type)
+
+        contact_groups = self._contact_group_uuids(request.user)
+        rows = Contact.objects.filter(user=request.user).values(
+            "pk", "first_name", "last_name", "email", "phone_number", "uuid",
+        )
+        return Response([self._row_to_dict(row, contact_groups) for row in rows])
+
+    def _stream_rows(self, request: Request) -> Iterator[str]:
+        """Yield one NDJSON line per contact, fetching rows in bounded chunks."""
+        contact_groups = self._contact_group_uuids(request.user)
+        rows = Contact.objects.filter(user=request.user).values(
+            "pk", "first_name", "last_name", "email", "phone_number", "uuid",
+        ).iterator(chunk_size=500)
+        for row in rows:
+            row_dict = self._row_to_dict(row, contact_groups)
+            row_dict["contact_groups"] = [str(contact_group) for contact_group in row_dict["contact_groups"]]
+            yield json.dumps(row_dict) + "\n"
+
+    @staticmethod
+    def _contact_group_uuids(user) -> "dict[Any, list[UUID]]":  # quoted: `list` is shadowed by the method above
+        """Map contact PK -> UUIDs of its groups, from a single query over the M2M through table."""
+        contact_groups: "dict[Any, list[UUID]]" = {}
+        through = ContactGroup.contacts.through
+        through_rows = through.objects.filter(contact__user=user).order_by("pk")
+        for contact_id, contact_group_uuid in through_rows.values_list("contact_id", "contactgroup__uuid"):
+            contact_groups.setdefault(contact_id, []).append(contact_group_uuid)
+        return contact_groups
+
+    @staticmethod
+    def _row_to_dict(row: dict, contact_groups: "dict[Any, list[UUID]]") -> dict:
+        return {
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "email": row["email"],
+            "phone_number": str(row["phone_number"]),
+            "contact_groups": contact_groups.get(row["pk"], []),
+            "uuid": str(row["uuid"]),
+        }
+
+    def perform_create(self, serializer) -> None:
+        """Attach the current user to the created contact."""
+        serializer.save(user=self.request.user)
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -114,11 +247,15 @@ class ContactListView(ContactView, ListViewMixin, CreateViewMixin):
         ],
     ),
 )
-class ContactGroupDetailView(ContactGroupView, RetrieveViewMixin, DestroyViewMixin):
+class ContactGroupDetailView(ContactGroupView, RetrieveDestroyAPIView):
     """View for retrieving/deleting a particular contact group by its UUID."""
 
     lookup_field = "uuid"
 
+    @method_decorator(etag(_detail_etag))
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return super().get(request, *args, **kwargs)
+
 
 @extend_schema_view(
     get=extend_schema(
@@ -132,9 +269,38 @@ class ContactGroupDetailView(ContactGroupView, RetrieveViewMixin, DestroyViewMix
         ],
     )
 )
-class ContactGroupListView(ContactGroupView, ListViewMixin, CreateViewMixin):
+class ContactGroupListView(ContactGroupView, ListCreateAPIView):
     """View for listing contact groups/creating a contact group."""
 
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Fast path for listing contact groups: build response dicts straight from `values()` rows.
+
+        Mirrors `ContactListView.list` - the response is plain scalars plus member UUIDs, so the
+        member lists come from a single query over the M2M through table instead of per-row
+        serializer field marshaling. POST still goes through `ContactGroupSerializer`.
+        """
+        rows = ContactGroup.objects.filter(user=request.user).values("pk", "name", "uuid")
+
+        contacts: "dict[Any, list[UUID]]" = {}
+        through = ContactGroup.contacts.through
+        through_rows = through.objects.filter(contactgroup__user=request.user).order_by("pk")
+        for contact_group_id, contact_uuid in through_rows.values_list("contactgroup_id", "contact__uuid"):
+            contacts.setdefault(contact_group_id, []).append(contact_uuid)
+
+        return Response([
+            {
+                "name": row["name"],
+                "contacts": contacts.get(row["pk"], []),
+                "uuid": str(row["uuid"]),
+            }
+            for row in rows
+        ])
+
+    def perform_create(self, serializer) -> None:
+        """Attach the current user to the created contact group."""
+        serializer.save(user=self.request.user)
+
 
 @extend_schema_view(
     delete=extend_schema(
@@ -150,7 +316,7 @@ class ContactGroupListView(ContactGroupView, ListViewMixin, CreateViewMixin):
 )
 class ContactGroupRemoveContactView(APIView):
     """View for removing a contact from contact group by its UUID."""
-    def delete(self, request: Request, contact_group_uuid: UUID, contact_uuid: UUID) -> Response:
+    def delete(self, request: Request, contact_group_uuid: str, contact_uuid: str) -> Response:
         """
         Remove a contact from a group.
 
@@ -159,23 +325,43 @@ class ContactGroupRemoveContactView(APIView):
         """
         user = self.request.user
 
-        try:
-            contact: Contact = Contact.objects.get(uuid=contact_uuid, user=user)  # type: ignore
-        except Contact.DoesNotExist:
-            return Response(
-                {"detail": f"Contact with UUID '{contact_uuid}' does not exist for your user."},
-                status=status.HTTP_404_NOT_FOUND,
+        # Fast path: one DELETE on the through table covers the ownership checks and the unlink at once
+        deleted, _ = ContactGroup.contacts.through.objects.filter(
+            contact__uuid=contact_uuid,
+            contact__user=user,
+            contactgroup__uuid=contact_group_uuid,
+            contactgroup__user=user,
+        ).delete()
+
+        if deleted:
+            # Writing the through table directly fires no model signals - invalidate explicitly
+            invalidate_linked(contact_uuid, contact_group_uuid, user.pk)
+        else:
+            # Nothing was unlinked - tell apart "contact or group doesn't exist for this user" (404)
+            # from "both exist but weren't linked" (204) with a single UNION round trip instead of
+            # two separate existence checks
+            found = set(
+                Contact.objects.filter(uuid=contact_uuid, user=user)
+                .annotate(kind=Value("contact"))
+                .values_list("kind", flat=True)
+                .union(
+                    ContactGroup.objects.filter(uuid=contact_group_uuid, user=user)
+                    .annotate(kind=Value("contactgroup"))
+                    .values_list("kind", flat=True),
+                    all=True,
+                )
             )
+            if "contact" not in found:
+                return Response(
+                    {"detail": f"Contact with UUID '{contact_uuid}' does not exist for your user."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            if "contactgroup" not in found:
+                return Response(
+                    {"detail": f"ContactGroup with UUID '{contact_group_uuid}' does not exist for your user."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
 
-        try:
-            contact_group: ContactGroup = ContactGroup.objects.get(uuid=contact_group_uuid, user=user)  # type: ignore
-        except ContactGroup.DoesNotExist:
-            return Response(
-                {"detail": f"ContactGroup with UUID '{contact_group_uuid}' does not exist for your user."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-
-        contact_group.contacts.remove(contact)
         return Response("", status=status.HTTP_204_NO_CONTENT)
 
 
@@ -209,6 +395,14 @@ class ContactGroupAddListContactsView(ListCreateAPIView):
 
     serializer_class = ContactSerializer
 
+    _queryset_cache = None
+
+    def get_serializer_class(self):
+        """GET responses never write - use the read-only serializer, which builds no validator plumbing."""
+        if self.request.method == "GET":
+            return ContactReadSerializer
+        return super().get_serializer_class()
+
     def get_queryset(self) -> QuerySet[Contact]:
         """
         Filter contacts on the current user and contact group and prefetch related `contact_groups` to avoid N+1
@@ -216,15 +410,23 @@ class ContactGroupAddListContactsView(ListCreateAPIView):
 
         :raise Http404: if there is no contact group with given UUID
         """
-        user = self.request.user
-        contact_group_uuid: UUID = self.kwargs["contact_group_uuid"]
-
-        try:
-            contact_group: ContactGroup = ContactGroup.objects.get(user=user, uuid=contact_group_uuid)  # type: ignore
-        except ContactGroup.DoesNotExist as error:
-            raise Http404(f"ContactGroup with UUID '{contact_group_uuid}' does not exist for your user.") from error
-
-        return contact_group.contacts.prefetch_related("contact_groups")
+        if self._queryset_cache is None:
+            user = self.request.user
+            contact_group_uuid: str = self.kwargs["contact_group_uuid"]
+
+            try:
+                contact_group: ContactGroup = ContactGroup.objects.get(  # type: ignore
+                    user=user, uuid=contact_group_uuid,
+                )
+            except ContactGroup.DoesNotExist as error:
+                raise Http404(f"ContactGroup with UUID '{contact_group_uuid}' does not exist for your user.") from error
+
+            self._queryset_cache = contact_group.contacts.only(
+                "uuid", "first_name", "last_name", "email", "phone_number", "user",
+            ).prefetch_related(
+                Prefetch("contact_groups", queryset=ContactGroup.objects.only("uuid")),
+            )
+        return self._queryset_cache
 
     def create(self, request: Request,  *args: Any, **kwargs: Any) -> Response:
         """
@@ -236,19 +438,21 @@ class ContactGroupAddListContactsView(ListCreateAPIView):
         """
         user = request.user
         contact_uuid = request.data["uuid"]
-
-        try:
-            contact: Contact = Contact.objects.get(uuid=contact_uuid, user=user)  # type: ignore
-        except Contact.DoesNotExist:
+        contact_group_uuid: str = self.kwargs["contact_group_uuid"]
+
+        # Fetch the contact and resolve the group's PK in one round trip - the group is only needed
+        # for its PK, so it rides along as a subquery annotation instead of a second SELECT
+        contact = Contact.objects.filter(uuid=contact_uuid, user=user).annotate(
+            contact_group_pk=Subquery(
+                ContactGroup.objects.filter(uuid=contact_group_uuid, user=user).values("pk")[:1],
+            ),
+        ).first()
+        if contact is None:
             return Response(
                 {"detail": f"Contact with UUID '{contact_uuid}' does not exist for your user."},
                 status=status.HTTP_404_NOT_FOUND,
             )
-
-        contact_group_uuid: UUID = self.kwargs["contact_group_uuid"]
-        try:
-            contact_group: ContactGroup = ContactGroup.objects.get(uuid=contact_group_uuid, user=user)  # type: ignore
-        except ContactGroup.DoesNotExist:
+        if contact.contact_group_pk is None:
             return Response(
                 {"detail": f"ContactGroup with UUID '{contact_group_uuid}' does not exist for your user."},
                 status=status.HTTP_404_NOT_FOUND,
@@ -256,11 +460,14 @@ class ContactGroupAddListContactsView(ListCreateAPIView):
 
         serializer = ContactSerializer(contact, context={"request": request})
 
-        if contact in contact_group.contacts.all():
-            return Response(serializer.data, status=status.HTTP_303_SEE_OTHER)
-
-        contact_group.contacts.add(contact)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # One membership-check-plus-insert on the through table instead of materializing the group's
+        # entire contact list; `get_or_create` is also race-safe under concurrent adds
+        through = ContactGroup.contacts.through
+        _, created = through.objects.get_or_create(contact_id=contact.pk, contactgroup_id=contact.contact_group_pk)
+        if created:
+            # Writing the through table directly fires no model signals - invalidate explicitly
+            invalidate_linked(contact.uuid, contact_group_uuid, user.pk)
+        return Response(serializer.data, status=status.HTTP_200_OK if created else status.HTTP_303_SEE_OTHER)
 
 
 @extend_schema_view(
@@ -276,7 +483,24 @@ class ContactGroupAddListContactsView(ListCreateAPIView):
 class ContactGroupSearchView(ListAPIView):
     """View for searching contact groups by name."""
 
-    serializer_class = ContactGroupSerializer
+    serializer_class = ContactGroupReadSerializer
+
+    _queryset_cache = None
+
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """
+        Serve repeated searches from the cache.
+
+        Autocomplete UIs replay the same (user, name) queries constantly; the serialized result list
+        is kept for `SEARCH_TIMEOUT` seconds under a per-user generation key that the contacts
+        signals rotate on any group change, so hits never outlive a write for long.
+        """
+        key = get_search_cache_key(request.user.pk, request.query_params.get("name", ""))
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, SEARCH_TIMEOUT)
+        return Response(data)
 
     def get_queryset(self) -> QuerySet[ContactGroup]:
         """
@@ -284,8 +508,12 @@ class ContactGroupSearchView(ListAPIView):
 
         If `name` query parameter is empty - return all contact groups for the current user.
         """
-        user = self.request.user
-        name_query = self.request.query_params.get("name", "")
-        return ContactGroup.objects.filter(
-            user=user, name__icontains=name_query,
-        ).prefetch_related("contacts")  # type: ignore
+        if self._queryset_cache is None:
+            user = self.request.user
+            name_query = self.request.query_params.get("name", "")
+            self._queryset_cache = ContactGroup.objects.filter(
+                user=user, name__icontains=name_query,
+            ).only("uuid", "name", "user").prefetch_related(
+                Prefetch("contacts", queryset=Contact.objects.only("uuid")),
+            )
+        return self._queryset_cache  # type: ignore
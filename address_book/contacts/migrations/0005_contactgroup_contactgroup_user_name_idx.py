@@ -0,0 +1,35 @@
+# Generated by Django 4.0.8 on 2026-08-28 11:27
+
+from django.db import migrations, models
+
+
+def _create_trigram_index(apps, schema_editor):
+    """Index `name` for `icontains` search with pg_trgm; only Postgres supports trigram GIN indexes."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS contactgroup_name_trgm_idx '
+        'ON contacts_contactgroup USING gin (name gin_trgm_ops)'
+    )
+
+
+def _drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS contactgroup_name_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0004_alter_contact_email_alter_contact_first_name_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactgroup',
+            index=models.Index(fields=['user', 'name'], name='contactgroup_user_name_idx'),
+        ),
+        migrations.RunPython(_create_trigram_index, _drop_trigram_index),
+    ]
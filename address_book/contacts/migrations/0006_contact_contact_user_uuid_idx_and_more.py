@@ -0,0 +1,21 @@
+# Generated by Django 4.0.8 on 2026-08-28 11:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0005_contactgroup_contactgroup_user_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', 'uuid'], name='contact_user_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactgroup',
+            index=models.Index(fields=['user', 'uuid'], name='contactgroup_user_uuid_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.0.8 on 2026-08-28 11:35
+
+import address_book.contacts.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0006_contact_contact_user_uuid_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='contact',
+            name='uuid',
+            field=models.UUIDField(default=address_book.contacts.models.uuid7, editable=False, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='contactgroup',
+            name='uuid',
+            field=models.UUIDField(default=address_book.contacts.models.uuid7, editable=False, unique=True),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+def _reaim_trigram_index(apps, schema_editor):
+    """
+    Re-point the trigram index at the expression Postgres actually searches.
+
+    Django compiles `name__icontains` on Postgres to `UPPER(name::text) LIKE UPPER(...)`, so the
+    plain-column index from 0005 never matched the search query and every request case-folded each
+    scanned row. Indexing the `upper(...)` expression serves the query directly, with no per-row
+    case-folding and no extra column (`GeneratedField` only arrives in Django 5).
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS contactgroup_name_trgm_idx')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS contactgroup_name_upper_trgm_idx '
+        'ON contacts_contactgroup USING gin (upper(name::text) gin_trgm_ops)'
+    )
+
+
+def _restore_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS contactgroup_name_upper_trgm_idx')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS contactgroup_name_trgm_idx '
+        'ON contacts_contactgroup USING gin (name gin_trgm_ops)'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0007_alter_contact_uuid_alter_contactgroup_uuid'),
+    ]
+
+    operations = [
+        migrations.RunPython(_reaim_trigram_index, _restore_trigram_index),
+    ]
@@ -0,0 +1,82 @@
+"""
+ETag bookkeeping for contact/contact-group detail endpoints.
+
+The models carry no modification timestamp, so an opaque token per object UUID is kept in the cache
+and dropped whenever the object (or one of its M2M links) changes. Detail views use the token as the
+ETag: a conditional GET with a matching ``If-None-Match`` short-circuits to ``304 Not Modified``
+without touching the database or the serializer.
+"""
+from typing import Any
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Contact, ContactGroup
+
+_ETAG_KEY_TEMPLATE = "contacts:etag:{uuid}"
+ETAG_TIMEOUT = 5 * 60  # seconds
+
+_SEARCH_GENERATION_KEY_TEMPLATE = "contacts:search_generation:{user_pk}"
+_SEARCH_KEY_TEMPLATE = "contacts:search:{user_pk}:{generation}:{name_query}"
+SEARCH_TIMEOUT = 30  # seconds
+
+
+def get_etag(uuid: Any) -> str:
+    """Return the current tag for the object with the given UUID, minting a new one if not cached."""
+    return cache.get_or_set(_ETAG_KEY_TEMPLATE.format(uuid=uuid), lambda: uuid4().hex, ETAG_TIMEOUT)
+
+
+def get_search_cache_key(user_pk: Any, name_query: str) -> str:
+    """
+    Cache key for one user's search results for one name query.
+
+    Name queries can't be enumerated for deletion, so the key embeds a per-user generation token;
+    invalidation drops the token, orphaning every cached search for that user at once (stale entries
+    then simply age out via ``SEARCH_TIMEOUT``).
+    """
+    generation = cache.get_or_set(
+        _SEARCH_GENERATION_KEY_TEMPLATE.format(user_pk=user_pk), lambda: uuid4().hex, None,
+    )
+    return _SEARCH_KEY_TEMPLATE.format(user_pk=user_pk, generation=generation, name_query=name_query)
+
+
+def _invalidate(*uuids: Any) -> None:
+    cache.delete_many([_ETAG_KEY_TEMPLATE.format(uuid=uuid) for uuid in uuids])
+
+
+def _invalidate_search(*user_pks: Any) -> None:
+    cache.delete_many([_SEARCH_GENERATION_KEY_TEMPLATE.format(user_pk=user_pk) for user_pk in user_pks])
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=Contact)
+@receiver(post_save, sender=ContactGroup)
+@receiver(post_delete, sender=ContactGroup)
+def _invalidate_on_change(sender, instance, **kwargs) -> None:
+    _invalidate(instance.uuid)
+    if sender is ContactGroup:
+        _invalidate_search(instance.user_id)
+
+
+def invalidate_linked(contact_uuid: Any, contact_group_uuid: Any, user_pk: Any) -> None:
+    """
+    Invalidate after a direct through-table write (views link/unlink contacts without the related
+    manager). Django sends no model signals for auto-created models, so the through table can't be
+    covered by a receiver - the writing view calls this explicitly instead.
+    """
+    _invalidate(contact_uuid, contact_group_uuid)
+    _invalidate_search(user_pk)
+
+
+@receiver(m2m_changed, sender=ContactGroup.contacts.through)
+def _invalidate_on_m2m_change(sender, instance, action, reverse, model, pk_set, **kwargs) -> None:
+    """Cover related-manager writes (`add`/`remove`/`set`/`clear`), which bypass through post_save."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    uuids = [instance.uuid]
+    if pk_set:
+        uuids.extend(model.objects.filter(pk__in=pk_set).values_list("uuid", flat=True))
+    _invalidate(*uuids)
+    _invalidate_search(instance.user_id)
@@ -1,143 +1,148 @@
+from typing import Any
+
 import pytest
 
+from django.core.cache import cache
+
 from address_book.contacts.models import Contact, ContactGroup
 from address_book.users.models import User
 
 
+@pytest.fixture(scope="session")
+def test_model_instances(django_db_setup, django_db_blocker) -> "dict[str, Any]":
+    """
+    Create all test users, contacts and contact groups once per session, in four bulk round trips.
+
+    The rows are committed outside the per-test transaction, so every test sees them while its own
+    writes (including deletions of these rows) are discarded by pytest-django's rollback - setup cost
+    is paid once instead of per test. Creating each object with `create()`/`contacts.set()` costs
+    one-to-two queries apiece; batching per model (plus one `bulk_create` on the M2M through table)
+    keeps that one-off setup at a constant number of round trips.
+    """
+    with django_db_blocker.unblock():
+        # Idempotent under --reuse-db: drop leftovers if a previous session was interrupted
+        User.objects.filter(username__in=("test_username_1", "test_username_2")).delete()
+        instances = _create_test_model_instances()
+    yield instances
+    with django_db_blocker.unblock():
+        User.objects.filter(pk__in=(instances["user_1"].pk, instances["user_2"].pk)).delete()
+
+
+def _create_test_model_instances() -> "dict[str, Any]":
+    user_1, user_2 = User.objects.bulk_create([
+        User(name="Test User 1", username="test_username_1", email="user_1@test.com"),
+        User(name="Test User 2", username="test_username_2", email="user_2@test.com"),
+    ])
+    contact_1, contact_2, contact_3, contact_4, contact_5 = Contact.objects.bulk_create([
+        Contact(
+            first_name=f"first name {index}",
+            last_name=f"last name {index}",
+            email=f"contact_{index}@test.com",
+            phone_number="+31" + str(index) * 9,
+            user=user_2 if index == 5 else user_1,
+        )
+        for index in range(1, 6)
+    ])
+    contact_group_1, contact_group_2, contact_group_3 = ContactGroup.objects.bulk_create([
+        ContactGroup(name="contact group 1", user=user_1),
+        ContactGroup(name="contact group 2", user=user_1),
+        ContactGroup(name="contact group 3", user=user_2),
+    ])
+    ContactGroup.contacts.through.objects.bulk_create([
+        ContactGroup.contacts.through(contactgroup=contact_group_1, contact=contact_1),
+        ContactGroup.contacts.through(contactgroup=contact_group_1, contact=contact_2),
+        ContactGroup.contacts.through(contactgroup=contact_group_2, contact=contact_1),
+        ContactGroup.contacts.through(contactgroup=contact_group_2, contact=contact_3),
+        ContactGroup.contacts.through(contactgroup=contact_group_3, contact=contact_5),
+    ])
+    return {
+        "user_1": user_1,
+        "user_2": user_2,
+        "contact_1": contact_1,
+        "contact_2": contact_2,
+        "contact_3": contact_3,
+        "contact_4": contact_4,
+        "contact_5": contact_5,
+        "contact_group_1": contact_group_1,
+        "contact_group_2": contact_group_2,
+        "contact_group_3": contact_group_3,
+    }
+
+
 @pytest.fixture
-def user_1() -> User:
+def user_1(test_model_instances: "dict[str, Any]") -> User:
     """User that has contacts 1-4, and contact groups 1-2."""
-    return User.objects.create(
-        name="Test User 1",
-        username="test_username_1",
-        email="user_1@test.com",
-    )
+    return test_model_instances["user_1"]
 
 
 @pytest.fixture
-def user_2() -> User:
+def user_2(test_model_instances: "dict[str, Any]") -> User:
     """User that has contact 5, and contact group 3."""
-    return User.objects.create(
-        name="Test User 2",
-        username="test_username_2",
-        email="user_2@test.com",
-    )
+    return test_model_instances["user_2"]
 
 
 @pytest.fixture
-def contact_1(user_1: User) -> Contact:
+def contact_1(test_model_instances: "dict[str, Any]") -> Contact:
     """Contact of `user_1`, belongs to `contact_group_1` and `contact_group_2`."""
-    return Contact.objects.create(
-        first_name="first name 1",
-        last_name="last name 1",
-        email="contact_1@test.com",
-        phone_number="+31111111111",
-        user=user_1,
-    )
+    return test_model_instances["contact_1"]
 
 
 @pytest.fixture
-def contact_2(user_1: User) -> Contact:
+def contact_2(test_model_instances: "dict[str, Any]") -> Contact:
     """Contact of `user_1`, belongs to `contact_group_1`."""
-    return Contact.objects.create(
-        first_name="first name 2",
-        last_name="last name 2",
-        email="contact_2@test.com",
-        phone_number="+31222222222",
-        user=user_1,
-    )
+    return test_model_instances["contact_2"]
 
 
 @pytest.fixture
-def contact_3(user_1: User) -> Contact:
+def contact_3(test_model_instances: "dict[str, Any]") -> Contact:
     """Contact of `user_1`, belongs to `contact_group_2`."""
-    return Contact.objects.create(
-        first_name="first name 3",
-        last_name="last name 3",
-        email="contact_3@test.com",
-        phone_number="+31333333333",
-        user=user_1,
-    )
+    return test_model_instances["contact_3"]
 
 
 @pytest.fixture
-def contact_4(user_1: User) -> Contact:
+def contact_4(test_model_instances: "dict[str, Any]") -> Contact:
     """Contact of `user_1`, doesn't belong to any group."""
-    return Contact.objects.create(
-        first_name="first name 4",
-        last_name="last name 4",
-        email="contact_4@test.com",
-        phone_number="+31444444444",
-        user=user_1,
-    )
+    return test_model_instances["contact_4"]
 
 
 @pytest.fixture
-def contact_5(user_2: User) -> Contact:
+def contact_5(test_model_instances: "dict[str, Any]") -> Contact:
     """Contact of `user_2`, belongs to `contact_group_3`."""
-    return Contact.objects.create(
-        first_name="first name 5",
-        last_name="last name 5",
-        email="contact_5@test.com",
-        phone_number="+31555555555",
-        user=user_2,
-    )
+    return test_model_instances["contact_5"]
 
 
 @pytest.fixture
-def contact_group_1(user_1: User, contact_1: Contact, contact_2: Contact) -> ContactGroup:
+def contact_group_1(test_model_instances: "dict[str, Any]") -> ContactGroup:
     """Contact group of `user_1`, contains `contact_1`, `contact_2`."""
-    contact_group = ContactGroup.objects.create(
-        name="contact group 1",
-        user=user_1,
-    )
-    contact_group.contacts.set([
-        contact_1,
-        contact_2,
-    ])
-    return contact_group
+    return test_model_instances["contact_group_1"]
 
 
 @pytest.fixture
-def contact_group_2(user_1: User, contact_1: Contact, contact_3: Contact) -> ContactGroup:
+def contact_group_2(test_model_instances: "dict[str, Any]") -> ContactGroup:
     """Contact group of `user_1`, contains `contact_1`, `contact_3`."""
-    contact_group = ContactGroup.objects.create(
-        name="contact group 2",
-        user=user_1,
-    )
-    contact_group.contacts.set([
-        contact_1,
-        contact_3,
-    ])
-    return contact_group
+    return test_model_instances["contact_group_2"]
 
 
 @pytest.fixture
-def contact_group_3(user_2: User, contact_5: Contact) -> ContactGroup:
+def contact_group_3(test_model_instances: "dict[str, Any]") -> ContactGroup:
     """Contact group of `user_2`, contains `contact_5`."""
-    contact_group = ContactGroup.objects.create(
-        name="contact group 3",
-        user=user_2,
-    )
-    contact_group.contacts.set([
-        contact_5,
-    ])
-    return contact_group
+    return test_model_instances["contact_group_3"]
 
 
 @pytest.fixture(autouse=True)
-def create_test_model_instances(
-    contact_group_1: ContactGroup,
-    contact_group_2: ContactGroup,
-    contact_group_3: ContactGroup,
-) -> None:
+def create_test_model_instances(db, test_model_instances: "dict[str, Any]") -> None:
     """
-    Create contacts, contact groups, users for test purposes.
+    Expose the session-created contacts, contact groups and users to every test.
 
     Relationships:
         user_1: [contact_group_1, contact_group_2], [contact_1, contact_2, contact_3, contact_4]
         contact_group_1: [contact_1, contact_2]
         contact_group_2: [contact_1, contact_3]
         ---------------------------------------
-        user_2: [], []
+        user_2: [contact_group_3], [contact_5]
+
+    Also clears the cache: the session fixture's `bulk_create` fires no signals, and per-test writes
+    that would normally drop signal-maintained entries (ETag tokens, search results) are rolled back,
+    so stale cache state must not leak from one test into the next.
     """
+    cache.clear()
@@ -0,0 +1,64 @@
+from typing import Any, Callable, Iterable, TypeAlias
+
+import pytest
+
+from address_book.contacts.api.serializers import ContactSerializer
+from address_book.contacts.models import ContactGroup
+
+from .test_views import EXCLUDE_CASES_FULL, POSTED_CONTACT
+
+CONTACT_DATA_FACTORY_RETURN_TYPE: TypeAlias = Callable[[Iterable[str]], POSTED_CONTACT]
+
+pytestmark = pytest.mark.django_db
+
+
+class TestContactSerializerValidation:
+    """
+    Field-exclusion validation coverage, exercised at the serializer layer.
+
+    The full powerset of optional-field exclusions only varies `ContactSerializer` validation, so it
+    runs here against `is_valid()` directly - no middleware, view dispatch, response rendering or row
+    INSERT per case. The HTTP-level POST test in `test_views` keeps a minimal one-per-field matrix
+    (full matrix available behind `--all-combinations`).
+    """
+
+    @pytest.fixture
+    def contact_data_factory(self, contact_group_1: ContactGroup) -> CONTACT_DATA_FACTORY_RETURN_TYPE:
+        """Return sample contact data with the given fields excluded."""
+
+        def _contact_data(exclude: Iterable[str] = ()) -> POSTED_CONTACT:
+            data: POSTED_CONTACT = dict(
+                first_name="fn",
+                last_name="ln",
+                email="fnln@test.com",
+                phone_number="+31682772975",
+                contact_groups=[str(contact_group_1.uuid)],
+            )
+            for field in exclude:
+                data.pop(field, None)
+            return data
+
+        return _contact_data
+
+    @pytest.mark.parametrize("exclude", EXCLUDE_CASES_FULL)
+    def test_valid_field_exclusions(
+        self,
+        contact_data_factory: CONTACT_DATA_FACTORY_RETURN_TYPE,
+        exclude: tuple[str, ...],
+    ):
+        serializer = ContactSerializer(data=contact_data_factory(exclude))
+        assert serializer.is_valid(), serializer.errors
+
+    @pytest.mark.parametrize(
+        "exclude", (
+            ("first_name", "last_name"),
+            ("email", "phone_number"),
+        ),
+    )
+    def test_insufficient_field_exclusions(
+        self,
+        contact_data_factory: CONTACT_DATA_FACTORY_RETURN_TYPE,
+        exclude: tuple[str, ...],
+    ):
+        serializer = ContactSerializer(data=contact_data_factory(exclude))
+        assert not serializer.is_valid()
@@ -1,29 +1,29 @@
+import pytest
 from rest_framework.test import APIRequestFactory
 
 from address_book.users.api.views import UserViewSet
 from address_book.users.models import User
 
+# Stateless and safe to share - instantiating a factory per test only redoes the same setup
+request_factory = APIRequestFactory()
+
 
 class TestUserViewSet:
-    def test_get_queryset(self, user: User):
-        request_factory = APIRequestFactory()
-        view = UserViewSet()
+    @pytest.fixture
+    def view(self, user: User) -> UserViewSet:
+        """`UserViewSet` with a request for `user` attached, built once here instead of inline per test."""
         request = request_factory.get("/fake-url/")
         request.user = user
 
+        view = UserViewSet()
         view.request = request
+        return view
 
+    def test_get_queryset(self, user: User, view: UserViewSet):
         assert user in view.get_queryset()
 
-    def test_me(self, user: User):
-        request_factory = APIRequestFactory()
-        view = UserViewSet()
-        request = request_factory.get("/fake-url/")
-        request.user = user
-
-        view.request = request
-
-        response = view.me(request)  # type: ignore
+    def test_me(self, user: User, view: UserViewSet):
+        response = view.me(view.request)  # type: ignore
 
         assert response.data == {
             "username": user.username,
@@ -0,0 +1,21 @@
+import orjson
+
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson.
+
+    Emits bytes directly instead of encoding an intermediate ``str``, which is several times faster
+    than the stdlib encoder on the list endpoints' nested payloads. UUIDs and datetimes are handled
+    natively; anything else falls back to ``str``, matching how DRF's encoder coerces leftovers.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None) -> bytes:
+        if data is None:
+            return b""
+        options = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=options)
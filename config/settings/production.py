@@ -10,7 +10,9 @@ ALLOWED_HOSTS = env.list("DJANGO_ALLOWED_HOSTS", default=["addressbook.yhaidai.n
 
 # DATABASES
 # ------------------------------------------------------------------------------
-DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)  # noqa F405
+# Every endpoint runs a handful of short queries, so reconnect latency dominates without persistent
+# connections; set CONN_MAX_AGE=0 instead when running behind a transaction-pooling pgbouncer
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=600)  # noqa F405
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -0,0 +1,8 @@
+def pytest_addoption(parser):
+    parser.addoption(
+        "--all-combinations",
+        action="store_true",
+        default=False,
+        help="Parametrize POST-validation tests over the full powerset of optional-field exclusions "
+             "instead of the minimal one-per-field matrix.",
+    )